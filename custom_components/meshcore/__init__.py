@@ -3,13 +3,14 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import OrderedDict
 from pathlib import Path
 from datetime import timedelta
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
 from homeassistant.components.http import StaticPathConfig
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -27,6 +28,7 @@ from .const import (
     DEFAULT_REPEATER_UPDATE_INTERVAL,
     CONF_INFO_INTERVAL,
     CONF_MESSAGES_INTERVAL,
+    CONTACT_KEY_PREFIX_LEN,
     DEFAULT_INFO_INTERVAL,
     DEFAULT_MESSAGES_INTERVAL,
     NodeType,
@@ -40,6 +42,9 @@ _LOGGER = logging.getLogger(__name__)
 # List of platforms to set up
 PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.SELECT, Platform.TEXT]
 
+# Contact types that accept logins and can be subscribed to, as plain ints
+LOGIN_NODE_TYPES = frozenset((int(NodeType.REPEATER), int(NodeType.ROOM_SERVER)))
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MeshCore from a config entry."""
     # Get configuration from entry
@@ -123,6 +128,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok and entry.entry_id in hass.data[DOMAIN]:
         # Get coordinator and disconnect
         coordinator = hass.data[DOMAIN][entry.entry_id]
+        if coordinator.cancel_log_refresh is not None:
+            coordinator.cancel_log_refresh()
+            coordinator.cancel_log_refresh = None
         await coordinator.api.disconnect()
         
         # Remove entry
@@ -160,9 +168,23 @@ class MeshCoreDataUpdateCoordinator(DataUpdateCoordinator):
         self._current_node_info = {}
         self._contacts = []
         
+        # Contacts split by node type, rebuilt once per contacts refresh
+        self.non_repeater_contacts = []
+        self.repeater_contacts = []
+        # Names of repeaters and room servers that can be subscribed to
+        self.repeater_contact_names = []
+        # Contact lookups by public key prefix and by advertised name
+        self.contacts_by_key_prefix: Dict[str, Dict[str, Any]] = {}
+        self.contacts_by_name: Dict[str, Dict[str, Any]] = {}
+        
         # Single map to track all message timestamps (key -> timestamp)
         # Keys can be channel indices (int) or public key prefixes (str)
         self.message_timestamps = {}
+        # Recently logged incoming messages and when they were last seen,
+        # used by the logbook to skip retransmits
+        self.recent_log_messages: OrderedDict[tuple, float] = OrderedDict()
+        # Cancels the logbook-triggered state refresh while it is waiting to run
+        self.cancel_log_refresh: CALLBACK_TYPE | None = None
         
         # Repeater subscription tracking
         self._repeater_stats = {}
@@ -180,7 +202,7 @@ class MeshCoreDataUpdateCoordinator(DataUpdateCoordinator):
             # Binary sensor entities
             if hasattr(self, "create_binary_sensor_entities"):
                 self.logger.info("Creating new binary sensor entities for contacts")
-                self.create_binary_sensor_entities(latest_contacts)
+                self.create_binary_sensor_entities()
                 
             # Diagnostic sensor entities
             if hasattr(self, "create_contact_diagnostic_sensors"):
@@ -219,7 +241,11 @@ class MeshCoreDataUpdateCoordinator(DataUpdateCoordinator):
             self.last_update_success_time = time.time()
     
     async def _fetch_node_info(self, result_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Fetch basic node information and battery status from the device."""
+        """Fetch basic node information and battery status from the device.
+        
+        Args:
+            result_data: The data dictionary to update
+        """
         self.logger.info("Fetching basic node info...")
         try:
             # Fetch basic node info
@@ -486,11 +512,13 @@ class MeshCoreDataUpdateCoordinator(DataUpdateCoordinator):
                 
                 # Update our contact cache
                 self._contacts = contacts_list
+                self._split_contacts(contacts_list)
                 result_data["contacts"] = contacts_list
                 
                 self.logger.info(f"Retrieved {len(contacts_list)} contacts")
             else:
                 self.logger.info("No contacts found or empty response")
+                self._split_contacts([])
                 result_data["contacts"] = []
         except Exception as ex:
             self.logger.error(f"Error getting contacts: {ex}")
@@ -500,6 +528,42 @@ class MeshCoreDataUpdateCoordinator(DataUpdateCoordinator):
         
         return result_data
     
+    def _split_contacts(self, contacts: List[Dict[str, Any]]) -> None:
+        """Split contacts into repeater and non-repeater views for the platforms."""
+        non_repeaters = []
+        repeaters = []
+        repeater_names = []
+        by_key_prefix = {}
+        by_name = {}
+        # Compare against a plain int rather than the enum member in the loop
+        repeater_type = int(NodeType.REPEATER)
+        for contact in contacts:
+            if not isinstance(contact, dict):
+                continue
+            contact_type = contact.get("type")
+            if contact_type == repeater_type:
+                repeaters.append(contact)
+            else:
+                non_repeaters.append(contact)
+            
+            # Repeaters and room servers are the contacts that accept logins
+            contact_name = contact.get("adv_name")
+            if contact_name and contact_type in LOGIN_NODE_TYPES:
+                repeater_names.append(contact_name)
+            
+            # Index for the logbook, the first contact wins as a list scan would
+            public_key = contact.get("public_key")
+            if public_key:
+                by_key_prefix.setdefault(public_key[:CONTACT_KEY_PREFIX_LEN], contact)
+            if contact_name:
+                by_name.setdefault(contact_name, contact)
+                
+        self.non_repeater_contacts = non_repeaters
+        self.repeater_contacts = repeaters
+        self.repeater_contact_names = repeater_names
+        self.contacts_by_key_prefix = by_key_prefix
+        self.contacts_by_name = by_name
+    
     async def _fetch_messages(self, result_data: Dict[str, Any]) -> None:
         """Fetch and process new messages from the device, logging them to the logbook."""
         self.logger.info("Checking for new messages...")
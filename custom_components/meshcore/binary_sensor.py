@@ -54,8 +54,10 @@ async def async_setup_entry(
     
     # Function to create and add entities for all contacts
     @callback
-    def create_contact_entities(contacts=None):
-        _LOGGER.info(f"Creating contact message entities with {len(contacts) if contacts else 0} contacts")
+    def create_contact_entities():
+        # Repeaters are already filtered out by the coordinator
+        contacts = coordinator.non_repeater_contacts
+        _LOGGER.info(f"Creating contact message entities with {len(contacts)} contacts")
         entities = []
         
         # Add channel entities (only first time)
@@ -73,12 +75,6 @@ async def async_setup_entry(
             _LOGGER.warning("No contacts provided for entity creation")
             return
         for contact in contacts:
-            if not isinstance(contact, dict):
-                continue
-
-            if contact.get("type") == NodeType.REPEATER:
-                continue
-                
             contact_name = contact.get("adv_name", "")
             public_key = contact.get("public_key", "")
             public_key_prefix = public_key[:12] if public_key else ""
@@ -189,7 +185,7 @@ async def async_setup_entry(
     
     # Run initially with the current contacts
     initial_contacts = coordinator.data.get("contacts", [])
-    create_contact_entities(initial_contacts)
+    create_contact_entities()
     
     # Create contact diagnostic binary sensors
     create_contact_diagnostic_binary_sensors(initial_contacts)
@@ -231,6 +227,17 @@ class MeshCoreMessageEntity(CoordinatorEntity, BinarySensorEntity):
         self.entity_key = entity_key
         self.public_key = public_key
         
+        # Resolve the entity type and message timestamp key once
+        self._is_channel = entity_key.startswith(CHANNEL_PREFIX)
+        if self._is_channel:
+            try:
+                self._lookup_key = extract_channel_idx(entity_key)
+            except (ValueError, TypeError):
+                _LOGGER.warning(f"Could not get channel index from {entity_key}")
+                self._lookup_key = None
+        else:
+            self._lookup_key = public_key or None
+        
         # Get device name for unique ID and entity_id
         device_key = get_device_key(coordinator)
         
@@ -252,7 +259,7 @@ class MeshCoreMessageEntity(CoordinatorEntity, BinarySensorEntity):
         self._attr_name = name
         
         # Set icon based on entity type
-        if self.entity_key.startswith(CHANNEL_PREFIX):
+        if self._is_channel:
             self._attr_icon = "mdi:message-bulleted"
         else:
             self._attr_icon = "mdi:message-text-outline"
@@ -265,26 +272,15 @@ class MeshCoreMessageEntity(CoordinatorEntity, BinarySensorEntity):
         
     def _check_message_activity(self) -> bool:
         """Check for recent message activity using coordinator timestamp data."""
-        # If message_timestamps doesn't exist, initialize it
-        if not hasattr(self.coordinator, "message_timestamps"):
-            self.coordinator.message_timestamps = {}
+        key = self._lookup_key
+        if key is None:
             return False
         
-        # Calculate cutoff time for activity window
-        cutoff_time = time.time() - MESSAGE_ACTIVITY_WINDOW.total_seconds()
-        
-        # Determine key to check
-        key = None
-        if self.entity_key.startswith(CHANNEL_PREFIX):
-            key = extract_channel_idx(self.entity_key)
-        elif self.public_key:
-            key = self.public_key
-        
-        # Check if we have recent messages
-        if key is not None and key in self.coordinator.message_timestamps:
-            return self.coordinator.message_timestamps[key] > cutoff_time
-        
-        return False
+        # Check if we have a message within the activity window
+        timestamp = self.coordinator.message_timestamps.get(key)
+        if timestamp is None:
+            return False
+        return timestamp > time.time() - MESSAGE_ACTIVITY_WINDOW.total_seconds()
     
     @property
     def is_on(self) -> bool:
@@ -309,26 +305,18 @@ class MeshCoreMessageEntity(CoordinatorEntity, BinarySensorEntity):
         }
         
         # Add appropriate attributes based on entity type
-        if self.entity_key.startswith(CHANNEL_PREFIX):
+        if self._is_channel:
             # For channel-specific message entities
-            try:
-                channel_idx = extract_channel_idx(self.entity_key)
-                attributes["channel_index"] = f"{channel_idx}"
-            except (ValueError, TypeError):
-                _LOGGER.warning(f"Could not get channel index from {self.entity_key}")
+            if self._lookup_key is not None:
+                attributes["channel_index"] = f"{self._lookup_key}"
         elif self.public_key:
             # For contact-specific message entities
             attributes["public_key"] = self.public_key
             
         # Add timestamp of last message if available
-        key = None
-        if self.entity_key.startswith(CHANNEL_PREFIX):
-            key = extract_channel_idx(self.entity_key)
-        elif self.public_key:
-            key = self.public_key
-            
-        if key is not None and hasattr(self.coordinator, "message_timestamps") and key in self.coordinator.message_timestamps:
-            timestamp = self.coordinator.message_timestamps[key]
+        key = self._lookup_key
+        timestamp = self.coordinator.message_timestamps.get(key) if key is not None else None
+        if timestamp is not None:
             attributes["last_message"] = datetime.fromtimestamp(timestamp).isoformat()
             
         return attributes
@@ -1,15 +1,20 @@
 """Config flow for MeshCore integration."""
 import logging
 import asyncio
+import contextlib
+import functools
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, List, Optional
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components import bluetooth
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import selector
 from bleak import BleakScanner
 
 from .const import (
@@ -35,15 +40,49 @@ from .const import (
     CONF_MESSAGES_INTERVAL,
     DEFAULT_INFO_INTERVAL,
     DEFAULT_MESSAGES_INTERVAL,
-    NodeType,
 )
 from .meshcore_api import MeshCoreAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+# Advertised name fragment identifying MeshCore BLE devices
+BLE_DEVICE_NAME_FILTER = "MeshCore"
+# How long discovered BLE devices are reused across form renders (seconds)
+BLE_DEVICE_CACHE_TTL = 30
+# Maximum time to scan for BLE devices (seconds)
+BLE_SCAN_TIMEOUT = 5.0
+# How long to keep listening after the first MeshCore device is seen (seconds)
+BLE_SCAN_SETTLE_TIME = 1.0
+# Directory of stable serial device links and the /dev prefixes of USB serial adapters
+SERIAL_BY_ID_PATH = "/dev/serial/by-id"
+SERIAL_DEVICE_PREFIXES = ("ttyUSB", "ttyACM")
+# Timeout for the plain TCP reachability check before connecting (seconds)
+TCP_PRECHECK_TIMEOUT = 1.0
+
+# BLE scan currently in progress, shared by all config flows
+_shared_ble_scan: Optional[asyncio.Task] = None
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
+# Interval validators, built once and shared by every schema
+MESSAGES_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=5, max=60))
+INFO_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=30, max=300))
+
+# Polling interval fields shared by every connection schema
+INTERVAL_FIELDS = {
+    vol.Optional(
+        CONF_MESSAGES_INTERVAL, 
+        default=DEFAULT_MESSAGES_INTERVAL,
+        description="How often to check for new messages (seconds)"
+    ): MESSAGES_INTERVAL_VALIDATOR,
+    vol.Optional(
+        CONF_INFO_INTERVAL, 
+        default=DEFAULT_INFO_INTERVAL,
+        description="How often to update device info and contacts (seconds)"
+    ): INFO_INTERVAL_VALIDATOR,
+}
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_CONNECTION_TYPE): vol.In(
@@ -56,32 +95,14 @@ USB_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_USB_PATH): str,
         vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): cv.positive_int,
-        vol.Optional(
-            CONF_MESSAGES_INTERVAL, 
-            default=DEFAULT_MESSAGES_INTERVAL,
-            description="How often to check for new messages (seconds)"
-        ): vol.All(cv.positive_int, vol.Range(min=5, max=60)),
-        vol.Optional(
-            CONF_INFO_INTERVAL, 
-            default=DEFAULT_INFO_INTERVAL,
-            description="How often to update device info and contacts (seconds)"
-        ): vol.All(cv.positive_int, vol.Range(min=30, max=300)),
+        **INTERVAL_FIELDS,
     }
 )
 
 BLE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_BLE_ADDRESS): str,
-        vol.Optional(
-            CONF_MESSAGES_INTERVAL, 
-            default=DEFAULT_MESSAGES_INTERVAL,
-            description="How often to check for new messages (seconds)"
-        ): vol.All(cv.positive_int, vol.Range(min=5, max=60)),
-        vol.Optional(
-            CONF_INFO_INTERVAL, 
-            default=DEFAULT_INFO_INTERVAL,
-            description="How often to update device info and contacts (seconds)"
-        ): vol.All(cv.positive_int, vol.Range(min=30, max=300)),
+        **INTERVAL_FIELDS,
     }
 )
 
@@ -89,128 +110,208 @@ TCP_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_TCP_HOST): str,
         vol.Optional(CONF_TCP_PORT, default=DEFAULT_TCP_PORT): cv.port,
-        vol.Optional(
-            CONF_MESSAGES_INTERVAL, 
-            default=DEFAULT_MESSAGES_INTERVAL,
-            description="How often to check for new messages (seconds)"
-        ): vol.All(cv.positive_int, vol.Range(min=5, max=60)),
-        vol.Optional(
-            CONF_INFO_INTERVAL, 
-            default=DEFAULT_INFO_INTERVAL,
-            description="How often to update device info and contacts (seconds)"
-        ): vol.All(cv.positive_int, vol.Range(min=30, max=300)),
+        **INTERVAL_FIELDS,
     }
 )
 
 
-async def validate_usb_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate the user input allows us to connect to the USB device."""
+@functools.lru_cache(maxsize=8)
+def _usb_port_schema(ports: tuple) -> vol.Schema:
+    """Build the USB schema with a dropdown of detected serial ports.
+    
+    The dropdown also accepts a typed path for devices that were not detected.
+    """
+    return vol.Schema(
+        {
+            vol.Required(CONF_USB_PATH): selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=list(ports),
+                    custom_value=True,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                )
+            ),
+            vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): cv.positive_int,
+            **INTERVAL_FIELDS,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _ble_device_schema(devices: frozenset) -> vol.Schema:
+    """Build the BLE schema with a dropdown of discovered devices."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_BLE_ADDRESS): vol.In(dict(sorted(devices))),
+            **INTERVAL_FIELDS,
+        }
+    )
+
+
+@contextlib.asynccontextmanager
+async def _map_connection_errors(failure: str):
+    """Turn any error raised while validating a connection into CannotConnect."""
     try:
-        api = MeshCoreAPI(
-            connection_type=CONNECTION_TYPE_USB,
-            usb_path=data[CONF_USB_PATH],
-            baudrate=data[CONF_BAUDRATE],
-        )
-        
-        # Try to connect with timeout
-        connect_success = await asyncio.wait_for(api.connect(), timeout=CONNECTION_TIMEOUT)
-        
-        # Check if connection was successful
-        if not connect_success:
-            _LOGGER.error("Failed to connect to USB device - connect() returned False")
-            raise CannotConnect("Device connection failed")
-            
-        # Get node info to verify communication
-        node_info = await api.get_node_info()
-        
-        # Validate we got meaningful info back
-        if not node_info or not isinstance(node_info, dict) or not node_info.get('name'):
-            _LOGGER.error("Connected to device but couldn't get node info")
-            raise CannotConnect("Device connected but no response to info request")
-            
-        # Disconnect when done
-        await api.disconnect()
-        
-        # If we get here, the connection was successful and we got valid info
-        return {"title": f"MeshCore Node {node_info.get('name', 'Unknown')}"}
+        yield
+    except CannotConnect:
+        raise
     except asyncio.TimeoutError:
         raise CannotConnect("Connection timed out")
     except Exception as ex:
         _LOGGER.error("Validation error: %s", ex)
-        raise CannotConnect(f"Failed to connect: {str(ex)}")
+        raise CannotConnect(failure) from ex
 
 
-async def validate_ble_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate the user input allows us to connect to the BLE device."""
-    try:
-        api = MeshCoreAPI(
-            connection_type=CONNECTION_TYPE_BLE,
-            ble_address=data[CONF_BLE_ADDRESS],
-        )
-        
-        # Try to connect with timeout
-        connect_success = await asyncio.wait_for(api.connect(), timeout=CONNECTION_TIMEOUT)
+async def _validate_connection(connection_type: str, **api_kwargs: Any) -> Dict[str, Any]:
+    """Validate that we can connect to the device and that it answers info requests."""
+    async with _map_connection_errors("Failed to connect"):
+        api = MeshCoreAPI(connection_type=connection_type, **api_kwargs)
         
-        # Check if connection was successful
-        if not connect_success:
-            _LOGGER.error("Failed to connect to BLE device - connect() returned False")
-            raise CannotConnect("Device connection failed")
+        try:
+            # Try to connect with timeout
+            async with asyncio.timeout(CONNECTION_TIMEOUT):
+                connect_success = await api.connect()
             
-        # Get node info to verify communication
-        node_info = await api.get_node_info()
-        
-        # Validate we got meaningful info back
-        if not node_info or not isinstance(node_info, dict) or not node_info.get('name'):
-            _LOGGER.error("Connected to device but couldn't get node info")
-            raise CannotConnect("Device connected but no response to info request")
+            # Check if connection was successful
+            if not connect_success:
+                _LOGGER.error("Failed to connect to %s device - connect() returned False", connection_type.upper())
+                raise CannotConnect("Device connection failed")
+                
+            # Read node info from the connect handshake to verify communication
+            node_info = await api.get_handshake_node_info()
+            
+            # Validate we got meaningful info back
+            if not node_info or not isinstance(node_info, dict) or not node_info.get('name'):
+                _LOGGER.error("Connected to device but couldn't get node info")
+                raise CannotConnect("Device connected but no response to info request")
+        finally:
+            # Always release the port or link, whether validation passed or not
+            await api.disconnect()
             
-        # Disconnect when done
-        await api.disconnect()
-        
         # If we get here, the connection was successful and we got valid info
         return {"title": f"MeshCore Node {node_info.get('name', 'Unknown')}"}
-    except asyncio.TimeoutError:
-        raise CannotConnect("Connection timed out")
-    except Exception as ex:
-        _LOGGER.error("Validation error: %s", ex)
-        raise CannotConnect(f"Failed to connect: {str(ex)}")
+
+
+# Connection-specific form fields copied into the config entry data
+_USB_KEYS = (CONF_USB_PATH, CONF_BAUDRATE)
+_BLE_KEYS = (CONF_BLE_ADDRESS,)
+_TCP_KEYS = (CONF_TCP_HOST, CONF_TCP_PORT)
+
+
+def _build_entry_data(connection_type: str, keys: tuple, user_input: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the config entry data for a validated connection form."""
+    entry_data = {
+        CONF_CONNECTION_TYPE: connection_type,
+        CONF_MESSAGES_INTERVAL: user_input.get(CONF_MESSAGES_INTERVAL, DEFAULT_MESSAGES_INTERVAL),
+        CONF_INFO_INTERVAL: user_input.get(CONF_INFO_INTERVAL, DEFAULT_INFO_INTERVAL),
+        CONF_REPEATER_SUBSCRIPTIONS: [],  # Initialize with empty repeater subscriptions
+    }
+    entry_data.update((key, user_input[key]) for key in keys)
+    return entry_data
+
+
+async def validate_usb_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the user input allows us to connect to the USB device."""
+    return await _validate_connection(
+        CONNECTION_TYPE_USB,
+        usb_path=data[CONF_USB_PATH],
+        baudrate=data[CONF_BAUDRATE],
+    )
+
+
+async def validate_ble_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate the user input allows us to connect to the BLE device."""
+    return await _validate_connection(
+        CONNECTION_TYPE_BLE,
+        ble_address=data[CONF_BLE_ADDRESS],
+    )
 
 
 async def validate_tcp_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate the user input allows us to connect to the TCP device."""
+    host = data[CONF_TCP_HOST]
+    port = data[CONF_TCP_PORT]
+    
+    # Fail fast on unreachable hosts before starting the protocol handshake
+    async with _map_connection_errors("Host unreachable"):
+        async with asyncio.timeout(TCP_PRECHECK_TIMEOUT):
+            _, writer = await asyncio.open_connection(host, port)
+        writer.close()
+        await writer.wait_closed()
+    
+    return await _validate_connection(
+        CONNECTION_TYPE_TCP,
+        tcp_host=host,
+        tcp_port=port,
+    )
+
+
+def list_serial_ports() -> List[str]:
+    """List serial device paths that may be a MeshCore node.
+    
+    This does blocking filesystem I/O and must run in the executor.
+    """
+    ports = []
     try:
-        api = MeshCoreAPI(
-            connection_type=CONNECTION_TYPE_TCP,
-            tcp_host=data[CONF_TCP_HOST],
-            tcp_port=data[CONF_TCP_PORT],
+        # Devices with a stable by-id link are listed once, under that link
+        linked = set()
+        if os.path.isdir(SERIAL_BY_ID_PATH):
+            with os.scandir(SERIAL_BY_ID_PATH) as entries:
+                links = sorted(entry.path for entry in entries)
+            ports.extend(links)
+            linked.update(os.path.realpath(link) for link in links)
+        with os.scandir("/dev") as entries:
+            ports.extend(sorted(
+                entry.path for entry in entries
+                if entry.name.startswith(SERIAL_DEVICE_PREFIXES)
+                and entry.path not in linked
+            ))
+    except OSError as ex:
+        _LOGGER.debug("Could not list serial ports: %s", ex)
+    return ports
+
+
+async def async_scan_ble_devices(hass: HomeAssistant) -> Dict[str, str]:
+    """Scan for MeshCore BLE devices, joining a scan that is already running.
+    
+    Concurrent config flows share one scan instead of competing for the adapter.
+    The scan runs as a Home Assistant background task so it is cancelled on shutdown.
+    """
+    global _shared_ble_scan  # pylint: disable=global-statement
+    if _shared_ble_scan is None or _shared_ble_scan.done():
+        _shared_ble_scan = hass.async_create_background_task(
+            _async_run_ble_scan(), "meshcore BLE device scan"
         )
-        
-        # Try to connect with timeout
-        connect_success = await asyncio.wait_for(api.connect(), timeout=CONNECTION_TIMEOUT)
-        
-        # Check if connection was successful
-        if not connect_success:
-            _LOGGER.error("Failed to connect to TCP device - connect() returned False")
-            raise CannotConnect("Device connection failed")
-            
-        # Get node info to verify communication
-        node_info = await api.get_node_info()
-        
-        # Validate we got meaningful info back
-        if not node_info or not isinstance(node_info, dict) or not node_info.get('name'):
-            _LOGGER.error("Connected to device but couldn't get node info")
-            raise CannotConnect("Device connected but no response to info request")
-            
-        # Disconnect when done
-        await api.disconnect()
-        
-        # If we get here, the connection was successful and we got valid info
-        return {"title": f"MeshCore Node {node_info.get('name', 'Unknown')}"}
+    # Shield the shared scan so one flow going away doesn't cancel it for the others
+    return await asyncio.shield(_shared_ble_scan)
+
+
+async def _async_run_ble_scan() -> Dict[str, str]:
+    """Scan for MeshCore BLE devices, returning shortly after the first match."""
+    devices: Dict[str, str] = {}
+    found = asyncio.Event()
+
+    def _on_advertisement(device, advertisement_data) -> None:
+        # Devices advertise repeatedly, only label each one the first time
+        if device.address in devices:
+            return
+        name = advertisement_data.local_name or device.name
+        if name and BLE_DEVICE_NAME_FILTER in name:
+            devices[device.address] = f"{name} ({device.address})"
+            found.set()
+
+    scanner = BleakScanner(detection_callback=_on_advertisement)
+    await scanner.start()
+    try:
+        async with asyncio.timeout(BLE_SCAN_TIMEOUT):
+            await found.wait()
+        # Give other nearby devices a moment to advertise as well
+        await asyncio.sleep(BLE_SCAN_SETTLE_TIME)
     except asyncio.TimeoutError:
-        raise CannotConnect("Connection timed out")
-    except Exception as ex:
-        _LOGGER.error("Validation error: %s", ex)
-        raise CannotConnect(f"Failed to connect: {str(ex)}")
+        pass
+    finally:
+        await scanner.stop()
+
+    return devices
 
 
 class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: ignore
@@ -222,6 +323,9 @@ class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: igno
         """Initialize flow."""
         self.connection_type: Optional[str] = None
         self.discovery_info: Optional[Dict[str, Any]] = None
+        self._ble_devices_cache: Optional[Dict[str, str]] = None
+        self._usb_ports: Optional[List[str]] = None
+        self._ble_cache_ts: float = 0
         
     @staticmethod
     @callback
@@ -231,8 +335,6 @@ class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: igno
 
     async def async_step_user(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle the initial step."""
-        errors: Dict[str, str] = {}
-
         if user_input is not None:
             self.connection_type = user_input[CONF_CONNECTION_TYPE]
             
@@ -244,128 +346,132 @@ class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: igno
                 return await self.async_step_tcp()
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="user", data_schema=STEP_USER_DATA_SCHEMA
         )
 
     async def async_step_usb(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle USB configuration."""
-        errors: Dict[str, str] = {}
+        # Only allocate an errors dict when there is input to validate
+        errors: Optional[Dict[str, str]] = None
 
         if user_input is not None:
+            errors = {}
             try:
                 info = await validate_usb_input(self.hass, user_input)
-                return self.async_create_entry(title=info["title"], data={
-                    CONF_CONNECTION_TYPE: CONNECTION_TYPE_USB,
-                    CONF_USB_PATH: user_input[CONF_USB_PATH],
-                    CONF_BAUDRATE: user_input[CONF_BAUDRATE],
-                    CONF_MESSAGES_INTERVAL: user_input.get(CONF_MESSAGES_INTERVAL, DEFAULT_MESSAGES_INTERVAL),
-                    CONF_INFO_INTERVAL: user_input.get(CONF_INFO_INTERVAL, DEFAULT_INFO_INTERVAL),
-                    CONF_REPEATER_SUBSCRIPTIONS: [],  # Initialize with empty repeater subscriptions
-                })
+                return self.async_create_entry(
+                    title=info["title"],
+                    data=_build_entry_data(CONNECTION_TYPE_USB, _USB_KEYS, user_input),
+                )
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
 
-        # Always allow manual entry for USB path
-        # Skip trying to detect ports completely
+        # Detect serial ports once per flow, the listing is kept for re-renders
+        if self._usb_ports is None:
+            self._usb_ports = await self.hass.async_add_executor_job(list_serial_ports)
+
+        # Offer detected ports in a dropdown, otherwise allow manual entry
+        if self._usb_ports:
+            schema = _usb_port_schema(tuple(self._usb_ports))
+        else:
+            schema = USB_SCHEMA
+
         return self.async_show_form(
-            step_id="usb", 
-            data_schema=vol.Schema({
-                vol.Required(CONF_USB_PATH): str,
-                vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): cv.positive_int,
-                vol.Optional(
-                    CONF_MESSAGES_INTERVAL,
-                    default=DEFAULT_MESSAGES_INTERVAL
-                ): int,
-                vol.Optional(
-                    CONF_INFO_INTERVAL,
-                    default=DEFAULT_INFO_INTERVAL
-                ): int,
-            }),
-            errors=errors
+            step_id="usb", data_schema=schema, errors=errors
         )
 
     async def async_step_ble(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle BLE configuration."""
-        errors: Dict[str, str] = {}
+        # Only allocate an errors dict when there is input to validate
+        errors: Optional[Dict[str, str]] = None
 
         if user_input is not None:
+            errors = {}
             try:
                 info = await validate_ble_input(self.hass, user_input)
-                return self.async_create_entry(title=info["title"], data={
-                    CONF_CONNECTION_TYPE: CONNECTION_TYPE_BLE,
-                    CONF_BLE_ADDRESS: user_input[CONF_BLE_ADDRESS],
-                    CONF_MESSAGES_INTERVAL: user_input.get(CONF_MESSAGES_INTERVAL, DEFAULT_MESSAGES_INTERVAL),
-                    CONF_INFO_INTERVAL: user_input.get(CONF_INFO_INTERVAL, DEFAULT_INFO_INTERVAL),
-                    CONF_REPEATER_SUBSCRIPTIONS: [],  # Initialize with empty repeater subscriptions
-                })
+                return self.async_create_entry(
+                    title=info["title"],
+                    data=_build_entry_data(CONNECTION_TYPE_BLE, _BLE_KEYS, user_input),
+                )
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
 
-        # Scan for BLE devices
-        devices = {}
-        try:
-            scanner = BleakScanner()
-            discovered_devices = await scanner.discover(timeout=5.0)
-            for device in discovered_devices:
-                if device.name and "MeshCore" in device.name:
-                    devices[device.address] = f"{device.name} ({device.address})"
-        except Exception as ex:
-            _LOGGER.warning("Failed to scan for BLE devices: %s", ex)
-
-        # If we have discovered devices, show them in a dropdown
+        # Discover BLE devices
+        devices = await self._async_discover_ble_devices()
+
+        # If we have discovered devices, show them in a dropdown,
+        # otherwise allow manual entry of the address
         if devices:
-            schema = vol.Schema(
-                {
-                    vol.Required(CONF_BLE_ADDRESS): vol.In(devices),
-                    vol.Optional(
-                        CONF_MESSAGES_INTERVAL,
-                        default=DEFAULT_MESSAGES_INTERVAL
-                    ): int,
-                    vol.Optional(
-                        CONF_INFO_INTERVAL,
-                        default=DEFAULT_INFO_INTERVAL
-                    ): int,
-                }
-            )
+            schema = _ble_device_schema(frozenset(devices.items()))
         else:
-            # Otherwise, allow manual entry, but with simplified schema
-            schema = vol.Schema({
-                vol.Required(CONF_BLE_ADDRESS): str,
-                vol.Optional(
-                    CONF_MESSAGES_INTERVAL,
-                    default=DEFAULT_MESSAGES_INTERVAL
-                ): int,
-                vol.Optional(
-                    CONF_INFO_INTERVAL,
-                    default=DEFAULT_INFO_INTERVAL
-                ): int,
-            })
+            schema = BLE_SCHEMA
 
         return self.async_show_form(
             step_id="ble", data_schema=schema, errors=errors
         )
 
+    def _get_bluetooth_devices(self) -> Optional[Dict[str, str]]:
+        """Get MeshCore devices from the bluetooth integration's advertisement cache.
+        
+        Returns None when the bluetooth integration has no advertisements at all.
+        """
+        try:
+            service_infos = bluetooth.async_discovered_service_info(self.hass, connectable=True)
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.debug("Bluetooth integration not available: %s", ex)
+            return None
+
+        # Keep only MeshCore devices as we go rather than copying the whole cache
+        devices = {}
+        seen_any = False
+        for service_info in service_infos:
+            seen_any = True
+            name = service_info.name
+            if name and BLE_DEVICE_NAME_FILTER in name:
+                devices[service_info.address] = f"{name} ({service_info.address})"
+
+        return devices if seen_any else None
+
+    async def _async_discover_ble_devices(self) -> Dict[str, str]:
+        """Find MeshCore BLE devices, preferring the bluetooth integration cache."""
+        # Reuse recent results when the form is re-rendered, e.g. after an error
+        if (
+            self._ble_devices_cache is not None
+            and time.monotonic() - self._ble_cache_ts < BLE_DEVICE_CACHE_TTL
+        ):
+            return self._ble_devices_cache
+
+        devices = self._get_bluetooth_devices()
+        if devices is None:
+            # Fall back to scanning directly when the bluetooth integration isn't loaded
+            devices = {}
+            try:
+                devices = await async_scan_ble_devices(self.hass)
+            except Exception as ex:
+                _LOGGER.warning("Failed to scan for BLE devices: %s", ex)
+
+        self._ble_devices_cache = devices
+        self._ble_cache_ts = time.monotonic()
+        return devices
+
     async def async_step_tcp(self, user_input: Optional[Dict[str, Any]] = None) -> FlowResult:
         """Handle TCP configuration."""
-        errors: Dict[str, str] = {}
+        # Only allocate an errors dict when there is input to validate
+        errors: Optional[Dict[str, str]] = None
 
         if user_input is not None:
+            errors = {}
             try:
                 info = await validate_tcp_input(self.hass, user_input)
-                return self.async_create_entry(title=info["title"], data={
-                    CONF_CONNECTION_TYPE: CONNECTION_TYPE_TCP,
-                    CONF_TCP_HOST: user_input[CONF_TCP_HOST],
-                    CONF_TCP_PORT: user_input[CONF_TCP_PORT],
-                    CONF_MESSAGES_INTERVAL: user_input.get(CONF_MESSAGES_INTERVAL, DEFAULT_MESSAGES_INTERVAL),
-                    CONF_INFO_INTERVAL: user_input.get(CONF_INFO_INTERVAL, DEFAULT_INFO_INTERVAL),
-                    CONF_REPEATER_SUBSCRIPTIONS: [],  # Initialize with empty repeater subscriptions
-                })
+                return self.async_create_entry(
+                    title=info["title"],
+                    data=_build_entry_data(CONNECTION_TYPE_TCP, _TCP_KEYS, user_input),
+                )
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
@@ -373,20 +479,7 @@ class MeshCoreConfigFlow(config_entries.ConfigFlow, domain=DOMAIN): # type: igno
                 errors["base"] = "unknown"
 
         return self.async_show_form(
-            step_id="tcp", 
-            data_schema=vol.Schema({
-                vol.Required(CONF_TCP_HOST): str,
-                vol.Optional(CONF_TCP_PORT, default=DEFAULT_TCP_PORT): cv.port,
-                vol.Optional(
-                    CONF_MESSAGES_INTERVAL,
-                    default=DEFAULT_MESSAGES_INTERVAL
-                ): int,
-                vol.Optional(
-                    CONF_INFO_INTERVAL,
-                    default=DEFAULT_INFO_INTERVAL
-                ): int,
-            }),
-            errors=errors
+            step_id="tcp", data_schema=TCP_SCHEMA, errors=errors
         )
 
 
@@ -396,7 +489,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry):
         """Initialize options flow."""
         self.config_entry = config_entry
-        self.repeater_subscriptions = list(config_entry.data.get(CONF_REPEATER_SUBSCRIPTIONS, []))
+        # Repeater subscriptions keyed by repeater name
+        self.repeater_subscriptions: Dict[str, Dict[str, Any]] = {
+            r.get("name"): r for r in config_entry.data.get(CONF_REPEATER_SUBSCRIPTIONS, [])
+        }
         self.hass = None
 
     async def async_step_init(self, user_input=None):
@@ -411,21 +507,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 
             elif action == "remove_repeater" and user_input.get("repeater_to_remove"):
                 # Remove the selected repeater
-                repeater_to_remove = user_input.get("repeater_to_remove")
-                
-                # Get current repeater list
-                current_repeaters = self.repeater_subscriptions.copy()
-                
-                # Update the list without the removed repeater
-                self.repeater_subscriptions = [
-                    r for r in self.repeater_subscriptions 
-                    if r.get("name") != repeater_to_remove
-                ]
+                self.repeater_subscriptions.pop(user_input.get("repeater_to_remove"), None)
                 
                 # Update the config entry data
-                new_data = dict(self.config_entry.data)
-                new_data[CONF_REPEATER_SUBSCRIPTIONS] = self.repeater_subscriptions
-                self.hass.config_entries.async_update_entry(self.config_entry, data=new_data) # type: ignore
+                self._save_repeater_subscriptions()
                 
                 # Return to the init step to show updated list
                 return await self.async_step_init()
@@ -446,12 +531,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional(
                 CONF_MESSAGES_INTERVAL,
                 default=options.get(CONF_MESSAGES_INTERVAL, DEFAULT_MESSAGES_INTERVAL)
-            ): int,
+            ): MESSAGES_INTERVAL_VALIDATOR,
             
             vol.Optional(
                 CONF_INFO_INTERVAL,
                 default=options.get(CONF_INFO_INTERVAL, DEFAULT_INFO_INTERVAL)
-            ): int,
+            ): INFO_INTERVAL_VALIDATOR,
             
             vol.Optional(
                 "action"
@@ -463,7 +548,8 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         
         # If there are repeaters and the action is remove, add a selection dropdown
         if self.repeater_subscriptions and "action" in schema:
-            repeater_names = {r.get("name"): r.get("name") for r in self.repeater_subscriptions}
+            # vol.In labels plain sequences with the values themselves
+            repeater_names = [name for name in self.repeater_subscriptions if name]
             if repeater_names:
                 schema["repeater_to_remove"] = vol.In(repeater_names)
         
@@ -471,34 +557,25 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             step_id="init",
             data_schema=vol.Schema(schema),
             description_placeholders={
-                "repeaters": ", ".join([r.get("name", "Unknown") for r in self.repeater_subscriptions]) or "None configured"
+                "repeaters": ", ".join(name or "Unknown" for name in self.repeater_subscriptions) or "None configured"
             },
         )
         
         
+    def _save_repeater_subscriptions(self) -> None:
+        """Write the repeater subscriptions back to the config entry as a list."""
+        new_data = dict(self.config_entry.data)
+        new_data[CONF_REPEATER_SUBSCRIPTIONS] = list(self.repeater_subscriptions.values())
+        self.hass.config_entries.async_update_entry(self.config_entry, data=new_data) # type: ignore
+        
     def _get_repeater_contacts(self):
-        """Get repeater contacts from coordinator's cached data."""
-        # Get the coordinator
+        """Get repeater contact names from the coordinator's cached contact views."""
         coordinator = self.hass.data[DOMAIN].get(self.config_entry.entry_id) # type: ignore
-        if not coordinator or not coordinator.data:
+        if not coordinator:
             return []
             
-        # Extract repeater contacts from cached data
-        contacts = coordinator.data.get("contacts", [])
-        repeater_contacts = []
-        
-        for contact in contacts:
-            if not isinstance(contact, dict):
-                continue
-                
-            contact_name = contact.get("adv_name", "")
-            contact_type = contact.get("type")
-            
-            # Type 2 indicates a repeater
-            if contact_name and contact_type == NodeType.REPEATER or contact_type == NodeType.ROOM_SERVER:
-                repeater_contacts.append(contact_name)
-                
-        return repeater_contacts
+        # Kept up to date by the coordinator whenever contacts are refreshed
+        return coordinator.repeater_contact_names
         
     async def async_step_add_repeater(self, user_input=None):
         """Handle adding a new repeater subscription."""
@@ -510,22 +587,19 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             update_interval = user_input.get(CONF_REPEATER_UPDATE_INTERVAL, DEFAULT_REPEATER_UPDATE_INTERVAL)
             
             # Check if this repeater is already in the subscriptions
-            existing_names = [r.get("name") for r in self.repeater_subscriptions]
-            if repeater_name in existing_names:
+            if repeater_name in self.repeater_subscriptions:
                 errors["repeater_name"] = "already_configured"
             else:
                 # Add the new repeater subscription
-                self.repeater_subscriptions.append({
+                self.repeater_subscriptions[repeater_name] = {
                     "name": repeater_name,
                     "password": password,
                     "update_interval": update_interval,
                     "enabled": True,
-                })
+                }
                 
                 # Update the config entry data
-                new_data = dict(self.config_entry.data)
-                new_data[CONF_REPEATER_SUBSCRIPTIONS] = self.repeater_subscriptions
-                self.hass.config_entries.async_update_entry(self.config_entry, data=new_data) # type: ignore
+                self._save_repeater_subscriptions()
                 
                 # Return to the init step
                 return await self.async_step_init() # type: ignore
@@ -548,7 +622,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         return self.async_show_form(
             step_id="add_repeater",
             data_schema=vol.Schema({
-                vol.Required(CONF_REPEATER_NAME): vol.In({name: name for name in repeater_contacts}),
+                vol.Required(CONF_REPEATER_NAME): vol.In(repeater_contacts),
                 vol.Optional(CONF_REPEATER_PASSWORD, default=""): str,
                 vol.Optional(CONF_REPEATER_UPDATE_INTERVAL, default=DEFAULT_REPEATER_UPDATE_INTERVAL): int,
             }),
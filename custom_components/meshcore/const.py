@@ -46,6 +46,8 @@ DEFAULT_DEVICE_NAME: Final = "meshcore"
 MESSAGES_SUFFIX: Final = "messages"
 CONTACT_SUFFIX: Final = "contact"
 CHANNEL_PREFIX: Final = "ch_"
+# Public key hex characters used to index contacts (room server signatures are this short)
+CONTACT_KEY_PREFIX_LEN: Final = 8
 
 # Repeater subscription constants
 CONF_REPEATER_SUBSCRIPTIONS: Final = "repeater_subscriptions"
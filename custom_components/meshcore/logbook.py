@@ -1,16 +1,19 @@
 """Logbook integration for MeshCore."""
 import logging
 import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Callable, Iterable
 from datetime import datetime
 
 from homeassistant.core import HomeAssistant, callback, Event
+from homeassistant.helpers.event import async_call_later
 
 from .const import (
     DOMAIN,
     ENTITY_DOMAIN_BINARY_SENSOR,
     ENTITY_DOMAIN_SENSOR,
     CONTACT_SUFFIX,
+    CONTACT_KEY_PREFIX_LEN,
     DEFAULT_DEVICE_NAME,
     NodeType,
 )
@@ -37,132 +40,165 @@ MESSAGE_TYPE_CHATROOM = "chatroom"
 MESSAGE_TYPE_CONTACT = "contact_discovery"
 MESSAGE_TYPE_SYSTEM = "system"
 
+# Raw message "type" values mapped to the message types above
+_MESSAGE_TYPES = {
+    "CHAN": MESSAGE_TYPE_CHANNEL,
+    "channel": MESSAGE_TYPE_CHANNEL,
+    "PRIV": MESSAGE_TYPE_DIRECT,
+    "direct": MESSAGE_TYPE_DIRECT,
+    "chatroom": MESSAGE_TYPE_CHATROOM,
+}
+
+# Window in which logged messages share one coordinator state refresh (seconds)
+LOG_REFRESH_DELAY = 0.1
+
+# Identical messages seen again within this window are retransmits (seconds)
+DUPLICATE_MESSAGE_WINDOW = 2.0
+# Number of recent messages remembered for duplicate detection
+DUPLICATE_MESSAGE_CACHE_SIZE = 128
+
+# Coordinator messages are logged against, reused while its entry stays loaded
+_log_coordinator: Optional[Any] = None
+
+
+def _short_pubkey(data: Dict[str, Any]) -> str:
+    """Return the first 6 characters of the event's client public key, or ''."""
+    public_key = data.get("client_public_key")
+    return public_key[:6] if public_key else ""
+
+
 @callback
-def async_describe_events(
-    hass: HomeAssistant,
-    async_describe_event: Callable[[str, str, Callable[[Event], dict[str, str]]], None],
-) -> None:
-    """Describe logbook events."""
-    
-    @callback
-    def process_message_event(event: Event) -> dict[str, str]:
-        """Process MeshCore message events for logbook."""
-        data = event.data
-        message = data.get("message", "")
-        sender_name = data.get("sender_name", "Unknown")
-        message_type = data.get("message_type", "message")
-        channel = data.get("channel", "")
-        outgoing = data.get("outgoing", False)
-        
-        # Format message based on type and direction
-        if outgoing:
-            if message_type == MESSAGE_TYPE_CHANNEL:
-                # Outgoing channel message - format as "Sent to channel X: message"
-                channel_name = data.get('channel', data.get('receiver', 'Unknown').replace('channel_', ''))
-                description = f"Sent to channel {channel_name}: {message}"
-                icon = "mdi:message-arrow-right-outline"
-            else:
-                # Outgoing direct message
-                receiver = data.get('receiver', 'Unknown')
-                pub_key_short = data.get('client_public_key', '')[:6] if data.get('client_public_key') else ''
-                description = f"Sent to {receiver}{f' ({pub_key_short})' if pub_key_short else ''}: {message}"
-                icon = "mdi:message-arrow-right-outline"
-        elif message_type == MESSAGE_TYPE_CHANNEL:
-            # Format as <channel> Sender: Message
-            channel_display = data.get("channel_display", f"<{channel}>")
-            sender_display = data.get("sender_display", sender_name)
-            description = f"{channel_display} {sender_display}: {message}"
-            icon = "mdi:message-bulleted"
-        elif data.get("type") == "PRIV" and data.get("signature"):
-            # Handle room server messages
-            room_server_name = data.get("room_server_name", "Room Server")
-            client_name = data.get("client_name", data.get("signature", "Unknown Client"))
-            description = f"<{room_server_name}> {client_name}: {message}"
-            icon = "mdi:message-processing"
+def process_message_event(event: Event) -> dict[str, str]:
+    """Process MeshCore message events for logbook."""
+    data = event.data
+    message = data.get("message", "")
+    message_type = data.get("message_type", "message")
+    channel = data.get("channel", "")
+    outgoing = data.get("outgoing", False)
+    
+    # Format message based on type and direction
+    if outgoing:
+        if message_type == MESSAGE_TYPE_CHANNEL:
+            # Outgoing channel message - format as "Sent to channel X: message"
+            channel_name = data.get('channel', data.get('receiver', 'Unknown').replace('channel_', ''))
+            description = f"Sent to channel {channel_name}: {message}"
+            icon = "mdi:message-arrow-right-outline"
         else:
-            pub_key_short = data.get('client_public_key', '')[:6] if data.get('client_public_key') else ''
-            description = message
-            icon = "mdi:message-text"
+            # Outgoing direct message
+            receiver = data.get('receiver', 'Unknown')
+            pub_key_short = _short_pubkey(data)
+            description = f"Sent to {receiver}{f' ({pub_key_short})' if pub_key_short else ''}: {message}"
+            icon = "mdi:message-arrow-right-outline"
+    elif message_type == MESSAGE_TYPE_CHANNEL:
+        # Format as <channel> Sender: Message
+        channel_display = data.get("channel_display", f"<{channel}>")
+        sender_display = data.get("sender_display", data.get("sender_name", "Unknown"))
+        description = f"{channel_display} {sender_display}: {message}"
+        icon = "mdi:message-bulleted"
+    elif data.get("type") == "PRIV" and data.get("signature"):
+        # Handle room server messages
+        room_server_name = data.get("room_server_name", "Room Server")
+        client_name = data.get("client_name", data.get("signature", "Unknown Client"))
+        description = f"<{room_server_name}> {client_name}: {message}"
+        icon = "mdi:message-processing"
+    else:
+        description = message
+        icon = "mdi:message-text"
 
-            
-        return {
-            "name": "",
-            "message": description,
-            "domain": DOMAIN,
-            "icon": icon,
-        }
-        
-    @callback
-    def process_contact_event(event: Event) -> dict[str, str]:
-        """Process MeshCore contact events for logbook."""
-        data = event.data
-        contact_name = data.get("contact_name", "Unknown")
-        contact_type = data.get("contact_type", "Node")
         
-        return {
-            "name": contact_name,
-            "message": f"New {contact_type} discovered",
-            "domain": DOMAIN,
-            "icon": "mdi:account-plus",
-        }
-    
-    @callback
-    def process_client_message_event(event: Event) -> dict[str, str]:
-        """Process MeshCore client message events for logbook."""
-        data = event.data
-        message = data.get("message", "")
-        sender_name = data.get("sender_name", "")
-        receiver_name = data.get("receiver_name", "")
-        recipient_name = data.get("recipient_name", "")
-        is_incoming = data.get("is_incoming", True)
+    return {
+        "name": "",
+        "message": description,
+        "domain": DOMAIN,
+        "icon": icon,
+    }
+
+
+@callback
+def process_contact_event(event: Event) -> dict[str, str]:
+    """Process MeshCore contact events for logbook."""
+    data = event.data
+    contact_name = data.get("contact_name", "Unknown")
+    contact_type = data.get("contact_type", "Node")
+    
+    return {
+        "name": contact_name,
+        "message": f"New {contact_type} discovered",
+        "domain": DOMAIN,
+        "icon": "mdi:account-plus",
+    }
+
+
+@callback
+def process_client_message_event(event: Event) -> dict[str, str]:
+    """Process MeshCore client message events for logbook."""
+    data = event.data
+    message = data.get("message", "")
+    sender_name = data.get("sender_name", "")
+    receiver_name = data.get("receiver_name", "")
+    recipient_name = data.get("recipient_name", "")
+    is_incoming = data.get("is_incoming", True)
+    
+    # For incoming messages
+    if is_incoming:
+        # Use sender's name as the display name
+        name = sender_name if sender_name else "Unknown Sender"
+        # Just show the message content without repeating the name
+        description = message
+        icon = "mdi:message-text"
+    else:
+        # For outgoing messages
+        # Use the device (sender) name as the display name in the logbook
+        name = data.get("sender_name", "MeshCore")
         
-        # For incoming messages
-        if is_incoming:
-            # Use sender's name as the display name
-            name = sender_name if sender_name else "Unknown Sender"
-            # Just show the message content without repeating the name
-            description = message
-            icon = "mdi:message-text"
-        else:
-            # For outgoing messages
-            # Use the device (sender) name as the display name in the logbook
-            name = data.get("sender_name", "MeshCore")
+        # Format the recipient part consistently
+        receiver = recipient_name if recipient_name else (receiver_name if receiver_name else "Unknown")
+        description = f"To {receiver}: {message}"
             
-            # Format the recipient part consistently
-            receiver = recipient_name if recipient_name else (receiver_name if receiver_name else "Unknown")
-            description = f"To {receiver}: {message}"
-                
-            icon = "mdi:message-arrow-right-outline"
-        
-        _LOGGER.debug(f"Logbook entry: name={name}, message={description}, incoming={is_incoming}")
-        
-        return {
-            "name": name,
-            "message": description,
-            "domain": DOMAIN,
-            "icon": icon,
-        }
-        
+        icon = "mdi:message-arrow-right-outline"
+    
+    _LOGGER.debug("Logbook entry: name=%s, message=%s, incoming=%s", name, description, is_incoming)
+    
+    return {
+        "name": name,
+        "message": description,
+        "domain": DOMAIN,
+        "icon": icon,
+    }
+
+
+@callback
+def async_describe_events(
+    hass: HomeAssistant,
+    async_describe_event: Callable[[str, str, Callable[[Event], dict[str, str]]], None],
+) -> None:
+    """Describe logbook events."""
     async_describe_event(DOMAIN, EVENT_MESHCORE_MESSAGE, process_message_event)
     async_describe_event(DOMAIN, EVENT_MESHCORE_CONTACT, process_contact_event)
     async_describe_event(DOMAIN, EVENT_MESHCORE_CLIENT_MESSAGE, process_client_message_event)
 
+
 def normalize_message_data(message_data: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize message data to a standard format."""
     if not message_data:
         return {}
     
+    # Sender keys may arrive as raw bytes, convert them to hex once here
+    sender_key = message_data.get("pubkey_prefix")
+    if isinstance(sender_key, (bytes, bytearray)):
+        sender_key = sender_key.hex()
+    
     # Extract core message fields, handling different field names
     normalized = {
         "text": message_data.get("text", message_data.get("msg", "")),
-        "sender_key": message_data.get("pubkey_prefix"),
+        "sender_key": sender_key,
         "sender_name": message_data.get("sender_name", ""),
         "receiver_name": message_data.get("receiver", ""),
         "channel": message_data.get("channel", ""),
         "channel_idx": message_data.get("channel_idx"),
         "outgoing": message_data.get("outgoing", False),
         "snr": message_data.get("snr"),
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": time.time(),
     }
     
     # Add signature if present (for room server messages)
@@ -173,37 +209,78 @@ def normalize_message_data(message_data: Dict[str, Any]) -> Dict[str, Any]:
     message_type = MESSAGE_TYPE_DIRECT
     
     # Log input data for debugging channel messages
-    _LOGGER.info(f"Message data for type check: type={message_data.get('type')}, channel={message_data.get('channel')} or {message_data.get('channel_idx')}")
+    _LOGGER.debug(
+        "Message data for type check: type=%s, channel=%s or %s",
+        message_data.get("type"), message_data.get("channel"), message_data.get("channel_idx"),
+    )
     
     if "type" in message_data:
-        if message_data["type"] in ["CHAN", "channel"]:
-            message_type = MESSAGE_TYPE_CHANNEL
-        elif message_data["type"] in ["PRIV", "direct"]:
-            message_type = MESSAGE_TYPE_DIRECT
-        elif message_data["type"] == "chatroom":
-            message_type = MESSAGE_TYPE_CHATROOM
+        message_type = _MESSAGE_TYPES.get(message_data["type"], MESSAGE_TYPE_DIRECT)
     elif normalized["channel"]:
         message_type = MESSAGE_TYPE_CHANNEL
         
     normalized["message_type"] = message_type
     normalized["type"] = message_data.get("type", "")
-    _LOGGER.info(f"Final message type: {message_type}, channel value: {normalized['channel']}")
+    _LOGGER.debug("Final message type: %s, channel value: %s", message_type, normalized["channel"])
     
     return normalized
 
-def resolve_sender_info(hass: HomeAssistant, message: Dict[str, Any]) -> Dict[str, Any]:
+def _is_duplicate(recent_messages: OrderedDict, key: tuple) -> bool:
+    """Return True if the same message was logged within DUPLICATE_MESSAGE_WINDOW."""
+    now = time.monotonic()
+    last_seen = recent_messages.get(key)
+    recent_messages[key] = now
+    recent_messages.move_to_end(key)
+    if len(recent_messages) > DUPLICATE_MESSAGE_CACHE_SIZE:
+        recent_messages.popitem(last=False)
+    return last_seen is not None and now - last_seen < DUPLICATE_MESSAGE_WINDOW
+
+def _channel_index(value: Any) -> int:
+    """Return the channel index from an int or digit string, defaulting to 0."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return 0
+
+def find_contact_by_key(coordinator: Any, key_prefix: str) -> Optional[Dict[str, Any]]:
+    """Find the contact whose public key starts with key_prefix using the coordinator's index."""
+    prefix_len = len(key_prefix)
+    contact = coordinator.contacts_by_key_prefix.get(key_prefix[:CONTACT_KEY_PREFIX_LEN])
+    if contact is None:
+        if prefix_len >= CONTACT_KEY_PREFIX_LEN:
+            return None
+    elif contact.get("public_key", "")[:prefix_len] == key_prefix:
+        return contact
+        
+    # Prefixes shorter than the index key, or sharing it with another contact, need a scan
+    for contact in coordinator.data.get("contacts", []):
+        if isinstance(contact, dict):
+            public_key = contact.get("public_key")
+            if public_key is not None and public_key[:prefix_len] == key_prefix:
+                return contact
+    return None
+
+def get_log_coordinator(hass: HomeAssistant) -> Optional[Any]:
+    """Return the coordinator to log messages against, caching it between messages."""
+    global _log_coordinator  # pylint: disable=global-statement
+    coordinator = _log_coordinator
+    if (
+        coordinator is not None
+        and hass.data.get(DOMAIN, {}).get(coordinator.config_entry.entry_id) is coordinator
+    ):
+        return coordinator
+        
+    # Entry was reloaded or not found yet, look it up again
+    coordinator, _ = find_coordinator_with_device_name(hass.data)
+    _log_coordinator = coordinator
+    return coordinator
+
+def resolve_sender_info(coordinator: Optional[Any], message: Dict[str, Any]) -> Dict[str, Any]:
     """Resolve sender information from contacts list."""
-    # Find coordinator with contacts data
-    coordinator = None
-    for entry_id, coord in hass.data[DOMAIN].items():
-        if hasattr(coord, "data") and "contacts" in coord.data:
-            coordinator = coord
-            break
-    
-    if not coordinator:
+    if coordinator is None:
         return message
     
-    contacts = coordinator.data.get("contacts", [])
     sender_key = message["sender_key"]
     outgoing = message["outgoing"]
     receiver_name = message["receiver_name"]
@@ -213,73 +290,45 @@ def resolve_sender_info(hass: HomeAssistant, message: Dict[str, Any]) -> Dict[st
         # Special handling for PRIV messages with signature (room server messages)
         if message.get("type") == "PRIV" and message.get("signature"):
             # For PRIV messages with signature, pubkey_prefix is the room server's key
-            room_server_found = False
-            for contact in contacts:
-                if not isinstance(contact, dict):
-                    continue
-                    
-                # Check if this contact is the room server
-                if contact.get("public_key", "").startswith(sender_key):
-                    message["room_server_name"] = contact.get("adv_name", "Room Server")
-                    message["contact_public_key"] = contact.get("public_key")
-                    room_server_found = True
-                    break
-                    
-            # If room server not found, use a generic name with the prefix
-            if not room_server_found:
+            room_server = find_contact_by_key(coordinator, sender_key)
+            if room_server is not None:
+                message["room_server_name"] = room_server.get("adv_name", "Room Server")
+                message["contact_public_key"] = room_server.get("public_key")
+            else:
+                # If room server not found, use a generic name with the prefix
                 message["room_server_name"] = f"Room Server ({sender_key[:6]})"
                 
             # Try to look up the client name from contacts using signature as the key
             client_signature = message.get("signature", "")
-            client_found = False
-            
-            if client_signature:
-                for contact in contacts:
-                    if not isinstance(contact, dict):
-                        continue
-                        
-                    # Check if this contact's key prefix matches the signature
-                    if contact.get("public_key", "").startswith(client_signature):
-                        message["sender_name"] = contact.get("adv_name", "Unknown")
-                        client_found = True
-                        break
-            
-            # If no match found, just use the signature as client name
-            if not client_found:
+            client = find_contact_by_key(coordinator, client_signature) if client_signature else None
+            if client is not None:
+                message["sender_name"] = client.get("adv_name", "Unknown")
+            else:
+                # If no match found, just use the signature as client name
                 message["sender_name"] = message.get("signature", "Unknown Client")
             
-            _LOGGER.info(f"Room server message from {message['room_server_name']}, sender: {message['sender_name']}")
+            _LOGGER.debug("Room server message from %s, sender: %s", message["room_server_name"], message["sender_name"])
         else:
             # Standard direct message handling
-            for contact in contacts:
-                if not isinstance(contact, dict):
-                    continue
-                    
-                # Check if this contact is the sender
-                if contact.get("public_key", "").startswith(sender_key):
-                    message["sender_name"] = contact.get("adv_name", "Unknown")
-                    message["contact_public_key"] = contact.get("public_key")
-                    break
+            contact = find_contact_by_key(coordinator, sender_key)
+            if contact is not None:
+                message["sender_name"] = contact.get("adv_name", "Unknown")
+                message["contact_public_key"] = contact.get("public_key")
     
     # For outgoing messages, look up the receiver
     elif outgoing and isinstance(receiver_name, str):
-        for contact in contacts:
-            if not isinstance(contact, dict):
-                continue
-            
-            if contact.get("adv_name") == receiver_name:
-                message["contact_public_key"] = contact.get("public_key")
-                break
-    
-    # Extract sender name from channel message if applicable
-    if message["message_type"] == MESSAGE_TYPE_CHANNEL and message["text"] and ":" in message["text"]:
-        parts = message["text"].split(":", 1)
-        if len(parts) == 2 and parts[0].strip() and parts[1].strip():
-            extracted_sender = parts[0].strip()
-            extracted_message = parts[1].strip()
-            # Always update sender for channel messages
+        contact = coordinator.contacts_by_name.get(receiver_name)
+        if contact is not None:
+            message["contact_public_key"] = contact.get("public_key")
+    
+    # Extract sender name from channel message unless the sender is already known
+    if message["message_type"] == MESSAGE_TYPE_CHANNEL and not message["sender_name"]:
+        head, sep, tail = message["text"].partition(":")
+        extracted_sender = head.strip()
+        extracted_message = tail.strip()
+        if sep and extracted_sender and extracted_message:
             message["sender_name"] = extracted_sender
-            _LOGGER.debug(f"Extracted sender name '{message['sender_name']}' from channel message")
+            _LOGGER.debug("Extracted sender name '%s' from channel message", message["sender_name"])
             # Store both the original message and the extracted message
             message["original_text"] = message["text"]
             message["text"] = extracted_message
@@ -290,69 +339,116 @@ def resolve_sender_info(hass: HomeAssistant, message: Dict[str, Any]) -> Dict[st
     
     return message
 
-def update_coordinator_data(hass: HomeAssistant) -> None:
+def update_coordinator_data(coordinator: Any) -> None:
     """Update coordinator data with the most recent message info."""
-    # Get coordinator without storing messages in history
-    coordinator = None
-    for _, coord in hass.data[DOMAIN].items():
-        if hasattr(coord, "data"):
-            coordinator = coord
-            break
-            
-    if coordinator:
+    if coordinator.cancel_log_refresh is not None:
+        return
+        
+    @callback
+    def _refresh(_now: datetime) -> None:
+        coordinator.cancel_log_refresh = None
         # Simply trigger coordinator update to refresh states
         coordinator.async_set_updated_data(coordinator.data)
+        
+    # Coalesce a burst of messages into a single state refresh,
+    # the entry cancels it if it is unloaded before it runs
+    coordinator.cancel_log_refresh = async_call_later(coordinator.hass, LOG_REFRESH_DELAY, _refresh)
 
 def handle_log_message(hass: HomeAssistant, message_data: Dict[str, Any]) -> None:
     """Record message using Home Assistant events."""
     if not message_data:
         return
     
-    # Find the coordinator and get the device name
-    coordinator, _ = find_coordinator_with_device_name(hass.data)
-    device_key = get_device_key(coordinator)
-    
     # Process message through the pipeline
     message = normalize_message_data(message_data)
-    message = resolve_sender_info(hass, message)
+    
+    coordinator = get_log_coordinator(hass)
+    
+    # Retransmits of the same received message would otherwise be logged twice,
+    # the user's own sends are always logged
+    if (
+        coordinator is not None
+        and not message["outgoing"]
+        and _is_duplicate(coordinator.recent_log_messages, (
+            message["type"],
+            message["sender_key"],
+            # Room server posts carry the real author in the signature
+            message.get("signature"),
+            message["channel_idx"],
+            message["text"],
+        ))
+    ):
+        _LOGGER.debug("Skipping duplicate message: %s", message["text"])
+        return
+    
+    # Receive time as an epoch for entity state, ISO formatted for the event
+    received_at = message["timestamp"]
+    timestamp = datetime.fromtimestamp(received_at).isoformat()
+    
+    # Without a coordinator there are no contacts or entities to attribute the
+    # message to, so just record the text
+    if coordinator is None:
+        hass.bus.async_fire(EVENT_MESHCORE_MESSAGE, {
+            "message": message["text"],
+            "text": message["text"],
+            "timestamp": timestamp,
+            "domain": DOMAIN,
+            "message_type": message["message_type"],
+            "outgoing": message["outgoing"],
+        })
+        return
+    
+    device_key = get_device_key(coordinator)
+    message = resolve_sender_info(coordinator, message)
+    
+    message_type = message["message_type"]
+    is_channel = message_type == MESSAGE_TYPE_CHANNEL
+    text = message["text"]
+    outgoing = message["outgoing"]
+    sender_name = message["sender_name"]
+    receiver_name = message["receiver_name"]
+    sender_key = message["sender_key"]
+    client_name = message.get("client_name")
+    contact_public_key = message.get("contact_public_key")
+    snr = message["snr"]
     
     # Prepare core event data
     event_data = {
-        "message": message["text"],
-        "text": message["text"],
-        "timestamp": message["timestamp"],
+        "message": text,
+        "text": text,
+        "timestamp": timestamp,
         "domain": DOMAIN,
-        "message_type": message["message_type"],
-        "outgoing": message["outgoing"],
+        "message_type": message_type,
+        "outgoing": outgoing,
         # Make sure type is included in the event data for logbook formatting
         "type": message.get("type"),
     }
     
     # Only include fields that have values
-    if message.get("sender_name"):
-        event_data["sender_name"] = message["sender_name"]
+    if sender_name:
+        event_data["sender_name"] = sender_name
     
-    if message.get("receiver_name"):
-        event_data["receiver_name"] = message["receiver_name"]
+    if receiver_name:
+        event_data["receiver_name"] = receiver_name
         
-    if message.get("client_name"):
-        event_data["client_name"] = message["client_name"]
-        event_data["name"] = message["client_name"]
+    if client_name:
+        event_data["client_name"] = client_name
+        event_data["name"] = client_name
     
     # Add SNR if available
-    if message.get("snr") is not None:
-        event_data["snr"] = message["snr"]
+    if snr is not None:
+        event_data["snr"] = snr
     
     # Add client-specific fields
-    if message.get("contact_public_key"):
-        event_data["client_public_key"] = message["contact_public_key"]
-    elif message.get("sender_key"):
-        event_data["client_public_key"] = message["sender_key"]
+    if contact_public_key:
+        event_data["client_public_key"] = contact_public_key
+    elif sender_key:
+        event_data["client_public_key"] = sender_key
     
     # Handle channel-specific messages
     # Check for channel_idx directly since that's what's in the data
-    if message["message_type"] == MESSAGE_TYPE_CHANNEL:
-        channel_idx = int(message.get("channel_idx", 0))
+    if is_channel:
+        channel_idx = _channel_index(message.get("channel_idx"))
         event_data["channel_idx"] = channel_idx
         event_data["channel"] = f"{channel_idx}"
         # todo determine this from channel list
@@ -363,14 +459,12 @@ def handle_log_message(hass: HomeAssistant, message_data: Dict[str, Any]) -> Non
         entity_id = get_channel_entity_id(ENTITY_DOMAIN_BINARY_SENSOR, device_key[:6], channel_idx)
         event_data["entity_id"] = entity_id
         
-        # Just store the plain message text
-        event_data["message"] = message["text"]
         # Store channel info separately
         event_data["channel_display"] = f"<{event_data["channel"]}>"
-        event_data["sender_display"] = message.get("sender_name", "")
+        event_data["sender_display"] = sender_name
         
         # Debug log the channel event details
-        _LOGGER.info(f"Firing channel message event with entity_id: {entity_id}, channel: {event_data["channel"]}")
+        _LOGGER.debug("Firing channel message event with entity_id: %s, channel: %s", entity_id, event_data["channel"])
         
         # Fire channel message event
         hass.bus.async_fire(EVENT_MESHCORE_MESSAGE, event_data)
@@ -380,49 +474,49 @@ def handle_log_message(hass: HomeAssistant, message_data: Dict[str, Any]) -> Non
         # Include room server and client name for display
         if message.get("room_server_name"):
             event_data["room_server_name"] = message["room_server_name"]
-        if message.get("signature"):
-            event_data["signature"] = message["signature"]
+        event_data["signature"] = message["signature"]
             
         # Use the room server pubkey for entity ID generation
         # We need a consistent entity ID, so use the same method as for contacts
-        if message.get("contact_public_key"):
+        if contact_public_key:
             # Use first 12 characters of the full public key if available
-            pubkey_for_entity = message.get("contact_public_key", "")[:12]
+            pubkey_for_entity = contact_public_key[:12]
         else:
             # Fall back to the pubkey_prefix from the message
-            pubkey_for_entity = message.get("sender_key", "")
+            pubkey_for_entity = sender_key or ""
             
         entity_id = get_contact_entity_id(ENTITY_DOMAIN_BINARY_SENSOR, device_key[:6], pubkey_for_entity[:6])
         event_data["entity_id"] = entity_id
             
-        _LOGGER.info(f"Firing room server message event with entity_id: {entity_id}, room server: {message.get('room_server_name')}, client: {message.get('client_name')}")
+        _LOGGER.debug(
+            "Firing room server message event with entity_id: %s, room server: %s, client: %s",
+            entity_id, message.get("room_server_name"), client_name,
+        )
             
         # Fire as a regular message event
         hass.bus.async_fire(EVENT_MESHCORE_MESSAGE, event_data)
     
     # Handle direct messages
-    elif message["message_type"] == MESSAGE_TYPE_DIRECT:
+    elif message_type == MESSAGE_TYPE_DIRECT:
         # For outgoing messages, use the receiver name
-        if message["outgoing"]:
-            client_name = sanitize_name(message["receiver_name"] or "Unknown")
+        if outgoing:
+            client_name = sanitize_name(receiver_name or "Unknown")
             
             # Use the contact_public_key directly from the message
-            pub_key = message.get("contact_public_key", "")
-            _LOGGER.info(f"Outgoing message to {message['receiver_name']}, using pubkey: {pub_key[:12]}")
+            pub_key = contact_public_key or ""
+            _LOGGER.debug("Outgoing message to %s, using pubkey: %.12s", receiver_name, pub_key)
             
             # Add recipient display info
-            event_data["recipient_name"] = message["receiver_name"]
-            event_data["name"] = message["receiver_name"]
+            event_data["recipient_name"] = receiver_name
+            event_data["name"] = receiver_name
         else:
             # For incoming messages, use the sender name
-            client_name = sanitize_name(message["sender_name"] or "Unknown")
+            client_name = sanitize_name(sender_name or "Unknown")
             # Use the sender key or public key if available
-            pub_key = message.get("contact_public_key", message.get("sender_key", "incoming"))
-            if isinstance(pub_key, (bytes, bytearray)):
-                pub_key = pub_key.hex()
+            pub_key = contact_public_key or sender_key or "incoming"
                 
             # For incoming, name is the sender
-            event_data["name"] = message["sender_name"]
+            event_data["name"] = sender_name
             
         # Add client name to event data for display
         event_data["client_name"] = client_name
@@ -432,58 +526,42 @@ def handle_log_message(hass: HomeAssistant, message_data: Dict[str, Any]) -> Non
         event_data["entity_id"] = entity_id
         
         # Add is_incoming flag for client messages
-        event_data["is_incoming"] = not message["outgoing"]
+        event_data["is_incoming"] = not outgoing
         
         # For outgoing direct messages, update the description
-        if message["outgoing"]:
-            client_name = message["sender_name"]
-            event_data["description"] = f"To {message['receiver_name']}: {message['text']}"
+        if outgoing:
+            client_name = sender_name
+            event_data["description"] = f"To {receiver_name}: {text}"
         
         # Debug log the direct message event details  
-        _LOGGER.info(f"Firing direct message event with entity_id: {entity_id}, client: {client_name}, outgoing: {message['outgoing']}")
+        _LOGGER.debug(
+            "Firing direct message event with entity_id: %s, client: %s, outgoing: %s",
+            entity_id, client_name, outgoing,
+        )
         
         # Fire direct message event
         hass.bus.async_fire(EVENT_MESHCORE_CLIENT_MESSAGE, event_data)
     
     # Update the message timestamps in the coordinator
-    try:
-        # Find coordinator
-        coordinator = None
-        for entry_id, coord in hass.data[DOMAIN].items():
-            if hasattr(coord, "data"):
-                coordinator = coord
-                break
-                
-        if coordinator:
-            # Initialize message timestamps if it doesn't exist
-            if not hasattr(coordinator, "message_timestamps"):
-                coordinator.message_timestamps = {}
-                
-            current_time = time.time()
-            
-            # Determine key based on message type
-            key = None
-            if message["message_type"] == MESSAGE_TYPE_CHANNEL:
-                key = int(message.get("channel_idx", 0))
-            elif message["message_type"] == MESSAGE_TYPE_DIRECT:
-                key = message["contact_public_key"]
-            
-            # Update timestamp if we have a valid key
-            if key is not None:
-                coordinator.message_timestamps[key] = current_time
-    except Exception as ex:
-        _LOGGER.error(f"Error updating message timestamps: {ex}")
+    # Determine key based on message type
+    key = None
+    if is_channel:
+        key = event_data["channel_idx"]
+    elif message_type == MESSAGE_TYPE_DIRECT:
+        key = contact_public_key
+    
+    # Update timestamp if we have a valid key
+    if key is not None:
+        coordinator.message_timestamps[key] = received_at
     
     # Update coordinator data (without storing history)
-    update_coordinator_data(hass)
+    update_coordinator_data(coordinator)
     
     # Log for debugging
-    if message["outgoing"]:
-        _LOGGER.debug("Logged outgoing %s message: %s to %s", 
-            message["message_type"], message["text"], message["receiver_name"])
+    if outgoing:
+        _LOGGER.debug("Logged outgoing %s message: %s to %s", message_type, text, receiver_name)
     else:
-        _LOGGER.debug("Logged incoming %s message: %s from %s", 
-            message["message_type"], message["text"], message["sender_name"])
+        _LOGGER.debug("Logged incoming %s message: %s from %s", message_type, text, sender_name)
 
 def log_contact_seen(hass: HomeAssistant, contact_data: Dict[str, Any]) -> None:
     """Record contact discovery using Home Assistant events."""
@@ -530,7 +608,9 @@ def log_contact_seen(hass: HomeAssistant, contact_data: Dict[str, Any]) -> None:
     hass.bus.async_fire(EVENT_MESHCORE_CLIENT_MESSAGE, client_event_data)
     
     # Update coordinator data
-    update_coordinator_data(hass)
+    coordinator = get_log_coordinator(hass)
+    if coordinator is not None:
+        update_coordinator_data(coordinator)
     
     # Log for debugging
     _LOGGER.info(
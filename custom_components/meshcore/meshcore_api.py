@@ -3,7 +3,8 @@ import logging
 import asyncio
 import shlex
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 from asyncio import Lock
 from enum import IntEnum
 
@@ -28,6 +29,10 @@ from .utils import get_node_type_str
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of recently received messages kept in memory
+MAX_CACHED_MESSAGES = 50
+
+
 class MeshCoreAPI:
     """API for interacting with MeshCore devices by directly using the MeshCore class."""
 
@@ -53,7 +58,7 @@ class MeshCoreAPI:
         self._mesh_core = None
         self._node_info = {}
         self._cached_contacts = {}
-        self._cached_messages = []
+        self._cached_messages: Deque[Dict[str, Any]] = deque(maxlen=MAX_CACHED_MESSAGES)
         
         # Add a lock to prevent concurrent access to the device
         self._device_lock = Lock()
@@ -200,23 +205,48 @@ class MeshCoreAPI:
                 self._node_info = self._mesh_core.self_info.copy()
                 
                 # Try to get device firmware info
-                try:
-                    _LOGGER.info("Requesting device firmware and hardware info")
-                    device_info = await self._mesh_core.send_device_query()
-                    if device_info and isinstance(device_info, dict):
-                        _LOGGER.info(f"Device firmware info: version={device_info.get('firmware_version', 'Unknown')}, "
-                                    f"manufacturer={device_info.get('manufacturer_name', 'Unknown')}")
-                        # Merge device info into node info
-                        self._node_info.update(device_info)
-                except Exception as device_ex:
-                    _LOGGER.warning(f"Could not get device info: {device_ex}")
+                await self._query_device_info()
+                
+                return self._node_info
                 
+            except Exception as ex:
+                _LOGGER.error("Error getting node info: %s", ex)
+                return {}
+    
+    async def get_handshake_node_info(self) -> Dict[str, Any]:
+        """Get node information from the handshake of the current connection.
+        
+        Connecting already sends APPSTART, which fills in the node's self info,
+        so this skips the second APPSTART that get_node_info() would send and
+        only adds the device firmware query.
+        """
+        if not self._connected or not self._mesh_core:
+            _LOGGER.error("Not connected to MeshCore device")
+            return {}
+            
+        async with self._device_lock:
+            try:
+                self._node_info = self._mesh_core.self_info.copy()
+                await self._query_device_info()
                 return self._node_info
                 
             except Exception as ex:
                 _LOGGER.error("Error getting node info: %s", ex)
                 return {}
     
+    async def _query_device_info(self) -> None:
+        """Merge device firmware and hardware info into the cached node info."""
+        try:
+            _LOGGER.info("Requesting device firmware and hardware info")
+            device_info = await self._mesh_core.send_device_query()
+            if device_info and isinstance(device_info, dict):
+                _LOGGER.info(f"Device firmware info: version={device_info.get('firmware_version', 'Unknown')}, "
+                            f"manufacturer={device_info.get('manufacturer_name', 'Unknown')}")
+                # Merge device info into node info
+                self._node_info.update(device_info)
+        except Exception as device_ex:
+            _LOGGER.warning(f"Could not get device info: {device_ex}")
+    
     async def get_battery(self) -> int:
         """Get battery level (raw value)."""
         if not self._connected or not self._mesh_core:
@@ -329,11 +359,8 @@ class MeshCoreAPI:
                         # Add to our message list
                         messages.append(res)
                         
-                        # Add to cached messages
+                        # Add to cached messages, the deque drops the oldest beyond its limit
                         self._cached_messages.append(res)
-                        # Keep only the latest 50 messages
-                        if len(self._cached_messages) > 50:
-                            self._cached_messages = self._cached_messages[-50:]
                     
                 _LOGGER.info(f"===== Retrieved {len(messages)} messages from device =====")
                 return messages
@@ -369,11 +396,8 @@ class MeshCoreAPI:
                 if msg:
                     _LOGGER.info(f"Message received: {msg}")
                     
-                    # Add to cached messages
+                    # Add to cached messages, the deque drops the oldest beyond its limit
                     self._cached_messages.append(msg)
-                    # Keep only the latest 50 messages
-                    if len(self._cached_messages) > 50:
-                        self._cached_messages = self._cached_messages[-50:]
                     
                     # We won't check for additional messages here to avoid
                     # blocking the device for too long
@@ -784,11 +808,8 @@ class MeshCoreAPI:
                         # Add to our message list
                         messages.append(res)
                         
-                        # Add to cached messages
+                        # Add to cached messages, the deque drops the oldest beyond its limit
                         self._cached_messages.append(res)
-                        # Keep only the latest 50 messages
-                        if len(self._cached_messages) > 50:
-                            self._cached_messages = self._cached_messages[-50:]
                 
                 _LOGGER.info(f"Retrieved {len(messages)} messages from room server {room_server_name}")
                 return messages
@@ -14,10 +14,7 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import (
-    DOMAIN,
-    NodeType,
-)
+from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -118,21 +115,14 @@ class MeshCoreContactSelect(CoordinatorEntity, SelectEntity):
         if not self.coordinator.data or not isinstance(self.coordinator.data, dict):
             return ["No contacts"]
             
-        contacts = self.coordinator.data.get("contacts", [])
+        # Include only client type contacts, not repeaters
+        contacts = self.coordinator.non_repeater_contacts
         if not contacts:
             return ["No contacts"]
             
-        # Include only client type contacts, not repeaters
         contact_options = []
         
         for contact in contacts:
-            if not isinstance(contact, dict):
-                continue
-                
-            # Skip repeaters, only include clients
-            if contact.get("type") == NodeType.REPEATER:
-                continue
-                
             # Get contact name
             name = contact.get("adv_name", "Unknown")
             public_key = contact.get("public_key", "")
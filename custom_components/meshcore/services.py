@@ -110,7 +110,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                         
                         # Get device name from coordinator for outgoing message logs
                         device_name = DEFAULT_DEVICE_NAME
-                        if hasattr(coordinator, "data") and "name" in coordinator.data:
+                        if coordinator.data:
                             device_name = coordinator.data.get("name", DEFAULT_DEVICE_NAME)
                         
                         # Determine the receiver name for the logbook
@@ -169,7 +169,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                         
                         # Get device name from coordinator for outgoing message logs
                         device_name = DEFAULT_DEVICE_NAME
-                        if hasattr(coordinator, "data") and "name" in coordinator.data:
+                        if coordinator.data:
                             device_name = coordinator.data.get("name", DEFAULT_DEVICE_NAME)
                         
                         # Log outgoing message to logbook
@@ -1,5 +1,6 @@
 """Utility functions for the MeshCore integration."""
 from __future__ import annotations
+import functools
 import logging
 from typing import Any, Dict, Optional
 
@@ -15,6 +16,10 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Character replacements applied by sanitize_name in a single pass
+_SLUG_TABLE = str.maketrans({" ": "_", "-": "_"})
+_SLUG_TABLE_KEEP_HYPHENS = str.maketrans({" ": "_"})
+
 
 def get_node_type_str(node_type: str | None) -> str:
     """Convert NodeType to a human-readable string."""
@@ -28,6 +33,7 @@ def get_node_type_str(node_type: str | None) -> str:
         return "Unknown"
 
 
+@functools.lru_cache(maxsize=1024)
 def sanitize_name(name: str, replace_hyphens: bool = True) -> str:
     """Convert a name to a format safe for entity IDs.
     
@@ -37,21 +43,19 @@ def sanitize_name(name: str, replace_hyphens: bool = True) -> str:
     if not name:
         return ""
         
-    safe_name = name.lower().replace(" ", "_")
-    if replace_hyphens:
-        safe_name = safe_name.replace("-", "_")
-    return safe_name.replace("__", "_")
+    table = _SLUG_TABLE if replace_hyphens else _SLUG_TABLE_KEEP_HYPHENS
+    return name.lower().translate(table).replace("__", "_")
 
 def get_device_key(coordinator: DataUpdateCoordinator, default: str = "") -> str:
     """Get the sanitized device name from coordinator data."""
-    if not coordinator or not hasattr(coordinator, "data") or not coordinator.data:
+    if not coordinator or not coordinator.data:
         return sanitize_name(default)
         
     return coordinator.data.get("public_key", default)
 
 def get_device_name(coordinator: DataUpdateCoordinator, default: str = DEFAULT_DEVICE_NAME) -> str:
     """Get the sanitized device name from coordinator data."""
-    if not coordinator or not hasattr(coordinator, "data") or not coordinator.data:
+    if not coordinator or not coordinator.data:
         return sanitize_name(default)
         
     raw_name = coordinator.data.get("name", default)
@@ -85,12 +89,14 @@ def format_entity_id(domain: str, device_name: str, entity_key: str, suffix: str
     return f"{domain}.{entity_name}"
 
 
+@functools.lru_cache(maxsize=1024)
 def get_channel_entity_id(domain: str, device_name: str, channel_idx: int, suffix: str = MESSAGES_SUFFIX) -> str:
     """Create a consistent entity ID for channel entities."""
     safe_channel = f"{CHANNEL_PREFIX}{channel_idx}"
     return format_entity_id(domain, device_name, safe_channel, suffix)
 
 
+@functools.lru_cache(maxsize=1024)
 def get_contact_entity_id(domain: str, device_name: str, pubkey: str, suffix: str = MESSAGES_SUFFIX) -> str:
     """Create a consistent entity ID for contact entities."""
     return format_entity_id(domain, device_name, pubkey, suffix)
@@ -120,7 +126,7 @@ def find_coordinator_with_device_name(hass_data: Dict[str, Any]) -> tuple[Option
     # Look through all coordinators to find one with a device name
     if hass_data and DOMAIN in hass_data:
         for entry_id, coord in hass_data[DOMAIN].items():
-            if hasattr(coord, "data") and "name" in coord.data:
+            if coord.data and "name" in coord.data:
                 coordinator = coord
                 device_name = get_device_name(coordinator)
                 break